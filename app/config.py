@@ -1,11 +1,39 @@
 DEFAULT_CONTAINER = "mkv"  # or "mp4"
 DEFAULT_RESOLUTION_LABEL = "Auto (Best)"
 FFMPEG_CHECK_TIMEOUT_SEC = 5
-PROGRESS_POLL_MS = 100
+# Progress queue poll interval while downloading, and while idle
+PROGRESS_POLL_MS = 50
+PROGRESS_IDLE_POLL_MS = 400
+# Slots in the worker → UI progress ring; progress snapshots are dropped when full
+PROGRESS_RING_SIZE = 256
+# Upper bound on messages handled per UI poll tick
+PROGRESS_MAX_BATCH = 64
 SPEED_SMOOTH_WINDOW_SEC = 5.0
+# Concurrent title prefetch for untitled items, and how long to wait for one
+TITLE_PROBE_WORKERS = 4
+TITLE_PROBE_TIMEOUT_SEC = 10.0
+# Minimum spacing between progress posts from the yt-dlp hook (~10 Hz)
+PROGRESS_EMIT_INTERVAL_SEC = 0.1
+
+# System dark-mode probe: cache lifetime and background refresh interval
+THEME_PROBE_TTL_SEC = 5.0
+THEME_POLL_INTERVAL_SEC = 30.0
+
+# Number of log lines kept in memory for the log window
+LOG_MAX_LINES = 1000
 
 # Settings file stored in the user's home directory
 SETTINGS_FILE_NAME = ".youtube_downloader_settings.json"
+# Settings changes are written once this long after the last change
+SETTINGS_PERSIST_DEBOUNCE_MS = 300
+
+# Playlist expansion results are cached under the home directory for a day
+PLAYLIST_CACHE_DIR_NAME = ".cache/simple-ytb-downloader"
+PLAYLIST_CACHE_TTL_SEC = 24 * 60 * 60
+
+# Cached metadata probes are reused for at most this long, well before the
+# signed stream URLs inside them expire
+PROBE_CACHE_TTL_SEC = 30 * 60
 
 # Advanced option: when enabled, yt-dlp will fetch one fragment at a time
 # to provide a steadier progress signal at the cost of peak speed.
@@ -6,19 +6,50 @@ Contains the `DownloadContext`, format selection, and the `download_single`
 function that emits progress dictionaries consumable by the UI.
 """
 
+import re
+import threading
 import time
-from collections import deque
+from array import array
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Any, Deque, Dict, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, Optional
 
-try:
-    import importlib
-    ytdlp = importlib.import_module("yt_dlp")
-except Exception:
-    ytdlp = None
-
-from .config import SPEED_SMOOTH_WINDOW_SEC
+from .config import SPEED_SMOOTH_WINDOW_SEC, PROGRESS_EMIT_INTERVAL_SEC, PROBE_CACHE_TTL_SEC
 from .utils import sanitize_filename, ensure_unique_path, human_readable_rate, format_eta
+from .ytdlp_support import get_ytdlp
+
+# Capacity of the speed-sample ring; at 20+ callbacks/sec this still spans
+# most of SPEED_SMOOTH_WINDOW_SEC, and older samples are simply overwritten.
+RATE_RING_SIZE = 128
+
+# Leading height in labels like "2160 (4K)" or "1080 (FHD)"
+_RES_RE = re.compile(r"^(\d{3,4})")
+
+# Format selector templates keyed by (merge_format, prefer_avc_for_mp4)
+_FORMAT_TEMPLATES = {
+    ("mp4", True): "bestvideo{cap}[vcodec^=avc1]+bestaudio[acodec^=mp4a]/best{cap}[ext=mp4]",
+}
+_DEFAULT_FORMAT_TEMPLATE = "bestvideo{cap}+bestaudio/best{cap}"
+
+# Bounded process-wide cache of metadata probes so a URL that is seen more
+# than once in a session is only extracted once. Entries are (monotonic time,
+# info) and expire after PROBE_CACHE_TTL_SEC.
+PROBE_CACHE_SIZE = 256
+_probe_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_probe_lock = threading.Lock()
+
+# Raw hook samples pending for the hook worker; bursts coalesce to the latest
+HOOK_QUEUE_SIZE = 8
+_HOOK_FINISHED = "finished"
+_HOOK_STOP = None
+
+_INV_MIB = 1.0 / 1048576
+
+_MP3_POSTPROCESSORS = [{
+    'key': 'FFmpegExtractAudio',
+    'preferredcodec': 'mp3',
+    'preferredquality': '0',
+}]
 
 
 class CancelledDownloadError(Exception):
@@ -28,7 +59,7 @@ class CancelledDownloadError(Exception):
 class DownloadContext:
     def __init__(self, target_dir: Path, merge_format: str, prefer_avc_for_mp4: bool, resolution_label: str,
                  ffmpeg_path: Optional[str] = None, limit_fragment_concurrency: bool = False,
-                 audio_bitrate_kbps: Optional[int] = None):
+                 audio_bitrate_kbps: Optional[int] = None, reserved_names: Optional[set[str]] = None):
         self.target_dir = target_dir
         self.merge_format = merge_format
         self.prefer_avc_for_mp4 = prefer_avc_for_mp4
@@ -36,95 +67,232 @@ class DownloadContext:
         self.ffmpeg_path = ffmpeg_path
         self.limit_fragment_concurrency = limit_fragment_concurrency
         self.audio_bitrate_kbps = audio_bitrate_kbps
-        self.rate_samples: Deque[Tuple[float, int]] = deque()
+        # Enforce CBR bitrate via ffmpeg when selected; fixed for the context
+        self._mp3_pp_args: Optional[list] = None
+        if audio_bitrate_kbps:
+            try:
+                self._mp3_pp_args = ['-c:a', 'libmp3lame', '-b:a', f'{int(audio_bitrate_kbps)}k']
+            except (TypeError, ValueError):
+                self._mp3_pp_args = None
+        # Fixed-capacity ring of (time, downloaded_bytes) samples for speed smoothing
+        self._ring_t = array("d", [0.0]) * RATE_RING_SIZE
+        self._ring_b = array("q", [0]) * RATE_RING_SIZE
+        self._head = 0
+        self._count = 0
+        # Last progress emit (time, percent) used to debounce UI posts
+        self._last_emit_t = 0.0
+        self._last_emit_pct = -1.0
+        # Progress formatting runs on a worker so the yt-dlp hook returns quickly
+        self._hook_q: Deque[Any] = deque(maxlen=HOOK_QUEUE_SIZE)
+        self._hook_event = threading.Event()
+        self._hook_thread: Optional[threading.Thread] = None
         self.fallback_counter = 1
+        # Output paths handed out during the batch, so repeats skip the stat();
+        # callers pass one set per batch so it outlives individual contexts
+        self._reserved_names: set[str] = reserved_names if reserved_names is not None else set()
+
+    def start_hook_worker(self, handler: Callable[[Any], None]) -> None:
+        """Start a thread that feeds queued hook samples to `handler`."""
+        # A context is reused across items, so speed/debounce state starts fresh per download
+        self._head = 0
+        self._count = 0
+        self._last_emit_t = 0.0
+        self._last_emit_pct = -1.0
+        self._hook_q.clear()
+        self._hook_event.clear()
+        self._hook_thread = threading.Thread(target=self._hook_worker, args=(handler,), daemon=True)
+        self._hook_thread.start()
+
+    def push_hook_sample(self, sample: Any) -> None:
+        """Queue a raw sample from the yt-dlp hook (called on yt-dlp's threads)."""
+        self._hook_q.append(sample)
+        self._hook_event.set()
+
+    def stop_hook_worker(self) -> None:
+        """Flush pending samples and wait for the worker to exit."""
+        thread = self._hook_thread
+        if thread is None:
+            return
+        self.push_hook_sample(_HOOK_STOP)
+        thread.join()
+        self._hook_thread = None
+
+    def _hook_worker(self, handler: Callable[[Any], None]) -> None:
+        q, event = self._hook_q, self._hook_event
+        while True:
+            event.wait()
+            event.clear()
+            while q:
+                sample = q.popleft()
+                if sample is _HOOK_STOP:
+                    return
+                try:
+                    handler(sample)
+                except Exception:
+                    pass
+
+    def add_rate_sample(self, now: float, downloaded: int) -> float:
+        """Record a sample and return the average speed (B/s) over the window."""
+        ring_t, ring_b = self._ring_t, self._ring_b
+        head = self._head
+        ring_t[head] = now
+        ring_b[head] = downloaded
+        self._head = (head + 1) % RATE_RING_SIZE
+        count = min(self._count + 1, RATE_RING_SIZE)
+        # Evict samples older than the window by advancing the tail
+        tail = (head - count + 1) % RATE_RING_SIZE
+        while count > 1 and (now - ring_t[tail]) > SPEED_SMOOTH_WINDOW_SEC:
+            tail = (tail + 1) % RATE_RING_SIZE
+            count -= 1
+        self._count = count
+        if count < 2:
+            return 0.0
+        dt = max(0.001, now - ring_t[tail])
+        db = max(0, downloaded - ring_b[tail])
+        return db / dt
+
+
+def _never_cancelled() -> bool:
+    return False
+
+
+def open_probe() -> Any:
+    """Return a YoutubeDL configured for metadata probes, or None without yt-dlp.
+
+    Reuse it for a batch of `probe_info` calls and `close()` it afterwards.
+    """
+    ytdlp = get_ytdlp()
+    if ytdlp is None:
+        return None
+    return ytdlp.YoutubeDL({"quiet": True, "skip_download": True, "noplaylist": True})
+
+
+def probe_info(url: str, ydl: Any = None) -> Optional[dict]:
+    """Return yt-dlp metadata for `url`, reusing a cached probe when available.
+
+    Args:
+        url: Video URL.
+        ydl: Optional instance from `open_probe` to avoid building a new one.
+    """
+    with _probe_lock:
+        entry = _probe_cache.get(url)
+        if entry is not None:
+            if (time.monotonic() - entry[0]) < PROBE_CACHE_TTL_SEC:
+                _probe_cache.move_to_end(url)
+                return entry[1]
+            del _probe_cache[url]
+    if ydl is not None:
+        info = ydl.extract_info(url, download=False)
+    else:
+        with open_probe() as ydl:
+            info = ydl.extract_info(url, download=False)
+    if isinstance(info, dict):
+        with _probe_lock:
+            _probe_cache[url] = (time.monotonic(), info)
+            while len(_probe_cache) > PROBE_CACHE_SIZE:
+                _probe_cache.popitem(last=False)
+    return info
+
+
+def forget_probe(url: str) -> None:
+    """Drop a cached probe (e.g. after its stream URLs turned out to be stale)."""
+    with _probe_lock:
+        _probe_cache.pop(url, None)
+
+
+def _stale_probe_errors(ytdlp: Any) -> tuple:
+    """Errors yt-dlp's download_with_info_file retries with a fresh extraction."""
+    utils = getattr(ytdlp, "utils", None)
+    names = ("DownloadError", "ReExtractInfo")
+    return tuple(e for e in (getattr(utils, n, None) for n in names) if isinstance(e, type))
 
 
 def select_format_string(ctx: DownloadContext) -> str:
     sel = ctx.resolution_label or ""
     merge_fmt = (ctx.merge_format or "mkv").lower()
     cap: Optional[int] = None
-    # Extract leading number from labels like "2160 (4K)" or "1080 (FHD)"
-    try:
-        import re
-        m = re.match(r"^(\d{3,4})", sel.strip())
-        if m:
-            cap = int(m.group(1))
-    except Exception:
-        cap = None
+    m = _RES_RE.match(sel.strip())
+    if m:
+        cap = int(m.group(1))
     # Auto defaults to 1080 (FHD)
     if cap is None and sel.lower().startswith("auto"):
         cap = 1080
     cap_clause = f"[height<={cap}]" if isinstance(cap, int) else ""
-    if merge_fmt == "mp4" and ctx.prefer_avc_for_mp4:
-        return f"bestvideo{cap_clause}[vcodec^=avc1]+bestaudio[acodec^=mp4a]/best{cap_clause}[ext=mp4]"
-    return f"bestvideo{cap_clause}+bestaudio/best{cap_clause}"
+    template = _FORMAT_TEMPLATES.get((merge_fmt, bool(ctx.prefer_avc_for_mp4)), _DEFAULT_FORMAT_TEMPLATE)
+    return template.format(cap=cap_clause)
 
 
-def download_single(url: str, ctx: DownloadContext, post_progress, ctx_entry: Optional[dict] = None, is_cancelled=None) -> str:
+def download_single(url: str, ctx: DownloadContext, post_progress, ctx_entry: Optional[dict] = None, is_cancelled=None,
+                    log_enabled: Optional[Callable[[], bool]] = None) -> str:
+    ytdlp = get_ytdlp()
     if ytdlp is None:
         raise RuntimeError("yt-dlp is not installed. Install with: pip install yt-dlp")
 
+    # Resolve the cancellation check once instead of guarding it per callback
+    cancelled = is_cancelled if callable(is_cancelled) else _never_cancelled
+
     def hook(d):
-        if d.get('status') == 'downloading':
-            if callable(is_cancelled) and is_cancelled():
+        # Called synchronously by yt-dlp between reads: only check for
+        # cancellation and hand the raw numbers to the hook worker
+        status = d.get('status')
+        if status == 'downloading':
+            if cancelled():
                 raise CancelledDownloadError("Cancelled by user")
-            downloaded = d.get('downloaded_bytes', 0) or 0
-            total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
-            percent = (downloaded / total * 100) if total else 0
-
-            now = time.time()
-            ctx.rate_samples.append((now, int(downloaded)))
-            while ctx.rate_samples and (now - ctx.rate_samples[0][0]) > SPEED_SMOOTH_WINDOW_SEC:
-                ctx.rate_samples.popleft()
-
-            avg_speed_bps = 0.0
-            if len(ctx.rate_samples) >= 2:
-                first_t, first_b = ctx.rate_samples[0]
-                last_t, last_b = ctx.rate_samples[-1]
-                dt = max(0.001, last_t - first_t)
-                db = max(0, last_b - first_b)
-                avg_speed_bps = db / dt
-
-            raw_speed = d.get('speed') or 0
-            speed_bps = avg_speed_bps or float(raw_speed or 0)
-            eta = None
-            if total and speed_bps > 0:
-                remaining = max(0, total - downloaded)
-                eta = int(remaining / speed_bps)
-            # Human friendly strings
-            speed_human = human_readable_rate(speed_bps) if speed_bps else ""
-            eta_str = format_eta(int(eta)) if eta is not None else ""
-            msg = (
-                f"Downloading {percent:0.1f}%"
-                + (f" @ {speed_human}" if speed_human else "")
-                + (f" in ETA {eta_str}" if eta_str else "")
-            )
-            # Single-line console style for logs
-            total_mib = (total / (1024 * 1024)) if total else None
-            log_line = f"[download] {percent:0.1f}%" + (
-                f" of {total_mib:.2f}MiB" if isinstance(total_mib, float) else ""
-            ) + (f" at {speed_human}" if speed_human else "") + (
-                f" in ETA {eta_str}" if eta_str else ""
-            )
-            post_progress({
-                "type": "progress",
-                "value": percent,
-                "text": msg,
-                "percent": percent,
-                "speed_bps": speed_bps,
-                "speed_human": speed_human,
-                "eta_seconds": eta if eta is not None else None,
-                "eta_human": eta_str,
-                "log_line": log_line,
-            })
-        elif d.get('status') == 'finished':
+            ctx.push_hook_sample((
+                time.time(),
+                d.get('downloaded_bytes', 0) or 0,
+                d.get('total_bytes') or d.get('total_bytes_estimate') or 0,
+                d.get('speed') or 0,
+            ))
+        elif status == 'finished':
+            ctx.push_hook_sample(_HOOK_FINISHED)
+
+    def emit_progress(sample):
+        if sample == _HOOK_FINISHED:
             post_progress({"type": "progress", "value": 100, "text": "Downloaded. Merging…", "percent": 100.0})
+            return
+        now, downloaded, total, raw_speed = sample
+        percent = (downloaded / total * 100) if total else 0
 
-    # Probe title first
-    ydl_info_opts = {"quiet": True, "skip_download": True, "noplaylist": True}
-    with ytdlp.YoutubeDL(ydl_info_opts) as ydl:
-        info = ydl.extract_info(url, download=False)
+        avg_speed_bps = ctx.add_rate_sample(now, int(downloaded))
+        # Debounce: the UI only repaints every poll tick, so skip
+        # formatting/posting unless enough time passed or a new whole percent
+        if (now - ctx._last_emit_t) < PROGRESS_EMIT_INTERVAL_SEC and int(percent) == int(ctx._last_emit_pct):
+            return
+        ctx._last_emit_t = now
+        ctx._last_emit_pct = percent
+
+        speed_bps = avg_speed_bps or float(raw_speed or 0)
+        eta = None
+        if total and speed_bps > 0:
+            remaining = max(0, total - downloaded)
+            eta = int(remaining / speed_bps)
+        # Human friendly strings, shared by the status text and the log line
+        speed_human = human_readable_rate(speed_bps) if speed_bps else ""
+        eta_str = format_eta(int(eta)) if eta is not None else ""
+        percent_str = f"{percent:0.1f}%"
+        eta_part = f" in ETA {eta_str}" if eta_str else ""
+        msg = "".join(("Downloading ", percent_str, f" @ {speed_human}" if speed_human else "", eta_part))
+        event = {
+            "type": "progress",
+            "value": percent,
+            "text": msg,
+            "percent": percent,
+            "speed_bps": speed_bps,
+            "speed_human": speed_human,
+            "eta_seconds": eta if eta is not None else None,
+            "eta_human": eta_str,
+        }
+        # Single-line console style for logs, only built when someone reads them
+        if log_enabled is not None and log_enabled():
+            total_mib_part = f" of {total * _INV_MIB:.2f}MiB" if total else ""
+            event["log_line"] = "".join((
+                "[download] ", percent_str, total_mib_part, f" at {speed_human}" if speed_human else "", eta_part,
+            ))
+        post_progress(event)
+
+    # Probe once; the same info dict is reused for the actual download below
+    info = probe_info(url)
     title = None
     if ctx_entry and isinstance(ctx_entry, dict):
         title = ctx_entry.get('entry_title') or None
@@ -144,11 +312,11 @@ def download_single(url: str, ctx: DownloadContext, post_progress, ctx_entry: Op
         pl_title = sanitize_filename(str(ctx_entry.get("pl_title") or "Playlist"))
         index_num = int(ctx_entry.get("pl_index"))
         base = ctx.target_dir / f"{pl_title} - {index_num:02d} - {safe_title}"
-        out_path = ensure_unique_path(base, merge_fmt)
+        out_path = ensure_unique_path(base, merge_fmt, ctx._reserved_names)
         outtmpl_value = str(out_path)
     else:
         base = ctx.target_dir / safe_title
-        out_path = ensure_unique_path(base, merge_fmt)
+        out_path = ensure_unique_path(base, merge_fmt, ctx._reserved_names)
         outtmpl_value = str(out_path)
 
     ydl_opts_base: Dict[str, Any] = {
@@ -172,36 +340,41 @@ def download_single(url: str, ctx: DownloadContext, post_progress, ctx_entry: Op
             pass
 
     selected_format = select_format_string(ctx)
+    ctx.start_hook_worker(emit_progress)
     try:
-        ydl_opts = dict(ydl_opts_base)
-        if merge_fmt == 'mp3':
-            ydl_opts['format'] = 'bestaudio/best'
-            ydl_opts['postprocessors'] = [
-                {
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '0',
-                }
-            ]
-            # Enforce CBR bitrate via ffmpeg when selected
-            if getattr(ctx, 'audio_bitrate_kbps', None):
-                try:
-                    kbps = int(ctx.audio_bitrate_kbps)
-                    ydl_opts['postprocessor_args'] = [
-                        '-c:a', 'libmp3lame',
-                        '-b:a', f'{kbps}k',
-                    ]
-                except Exception:
-                    pass
-        else:
-            ydl_opts['format'] = selected_format
-        with ytdlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
-    except Exception:
-        ydl_opts = dict(ydl_opts_base)
-        ydl_opts['format'] = 'best'
-        with ytdlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
+        try:
+            ydl_opts = dict(ydl_opts_base)
+            if merge_fmt == 'mp3':
+                ydl_opts['format'] = 'bestaudio/best'
+                ydl_opts['postprocessors'] = list(_MP3_POSTPROCESSORS)
+                if ctx._mp3_pp_args:
+                    ydl_opts['postprocessor_args'] = list(ctx._mp3_pp_args)
+            else:
+                ydl_opts['format'] = selected_format
+            with ytdlp.YoutubeDL(ydl_opts) as ydl:
+                if isinstance(info, dict):
+                    # Same path as --load-info-json: re-run format selection and
+                    # download without extracting the metadata a second time
+                    try:
+                        ydl.process_ie_result(ydl.sanitize_info(info, True), download=True)
+                    except CancelledDownloadError:
+                        raise
+                    except _stale_probe_errors(ytdlp):
+                        # The probe may be stale; extract again with the same options
+                        forget_probe(url)
+                        ydl.download([url])
+                else:
+                    ydl.download([url])
+        except CancelledDownloadError:
+            raise
+        except Exception:
+            ydl_opts = dict(ydl_opts_base)
+            ydl_opts['format'] = 'best'
+            with ytdlp.YoutubeDL(ydl_opts) as ydl:
+                ydl.download([url])
+    finally:
+        # Drain queued progress before reporting the saved path
+        ctx.stop_hook_worker()
 
     post_progress({"type": "status", "text": f"Saved to: {outtmpl_value}"})
     return outtmpl_value
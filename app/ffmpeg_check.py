@@ -6,6 +6,7 @@ Resolves bundled tools when running from a PyInstaller bundle and checks
 availability and version of FFmpeg/FFprobe.
 """
 
+import functools
 import shutil
 import subprocess
 import sys
@@ -48,9 +49,13 @@ def resolve_bundled_tool(name: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg() -> Tuple[bool, Optional[str], Optional[str], str]:
     """
     Returns (ok, ffmpeg_path, ffprobe_path, version_or_error)
+
+    The result is memoized for the process lifetime; call
+    `check_ffmpeg.cache_clear()` to force a fresh detection.
     """
     ffmpeg = resolve_bundled_tool("ffmpeg") or shutil.which("ffmpeg")
     ffprobe = resolve_bundled_tool("ffprobe") or shutil.which("ffprobe")
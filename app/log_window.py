@@ -27,13 +27,15 @@ def show_log_window(parent, log_lines: Iterable[str], error_details: Optional[st
     summary_var = StringVar(value="")
     ttk.Label(ctrl, textvariable=summary_var, foreground="#888").pack(side="left")
 
+    lines = list(log_lines)
+    payload = "\n".join(lines)
+    if error_details:
+        payload += "\n\n" + error_details
+
     def copy_all():
         try:
-            data = "\n".join(list(log_lines))
-            if error_details:
-                data += "\n\n" + error_details
             win.clipboard_clear()
-            win.clipboard_append(data)
+            win.clipboard_append(payload)
         except Exception:
             pass
 
@@ -41,31 +43,20 @@ def show_log_window(parent, log_lines: Iterable[str], error_details: Optional[st
 
     text = Text(win, wrap="word")
     text.pack(fill="both", expand=True)
-    try:
-        payload = "\n".join(list(log_lines))
-        if error_details:
-            payload += "\n\n" + error_details
-        text.insert("1.0", payload)
-    except Exception:
-        text.insert("1.0", "(No log)")
-
-    # Simple categorization
-    try:
-        data = text.get("1.0", "end")
-        cat = None
-        if "HTTP Error 4" in data or "403" in data:
-            cat = "Network/auth error (4xx)"
-        elif "HTTP Error 5" in data:
-            cat = "YouTube server error (5xx)"
-        elif "ffmpeg" in data.lower() and "not found" in data.lower():
-            cat = "FFmpeg missing"
-        elif "age-restricted" in data.lower():
-            cat = "Age-restricted content"
-        elif "blocked" in data.lower() or "geo" in data.lower():
-            cat = "Region-blocked content"
-        if cat:
-            summary_var.set(f"Category: {cat}")
-    except Exception:
-        pass
-
-
+    text.insert("1.0", payload)
+
+    # Simple categorization, run on the Python string rather than reading the widget back
+    lowered = payload.lower()
+    cat = None
+    if "HTTP Error 4" in payload or "403" in payload:
+        cat = "Network/auth error (4xx)"
+    elif "HTTP Error 5" in payload:
+        cat = "YouTube server error (5xx)"
+    elif "ffmpeg" in lowered and "not found" in lowered:
+        cat = "FFmpeg missing"
+    elif "age-restricted" in lowered:
+        cat = "Age-restricted content"
+    elif "blocked" in lowered or "geo" in lowered:
+        cat = "Region-blocked content"
+    if cat:
+        summary_var.set(f"Category: {cat}")
@@ -3,28 +3,85 @@ from __future__ import annotations
 """Planner utilities.
 
 Detects playlist URLs and optionally expands them into individual tasks
-using yt-dlp in extract-only mode.
+using yt-dlp in extract-only mode. Expansion results are cached on disk so
+re-opening the same playlist does not hit the network again.
 """
 
-from typing import Dict, List
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import PLAYLIST_CACHE_DIR_NAME, PLAYLIST_CACHE_TTL_SEC
+from .utils import sanitize_filename
+from .ytdlp_support import get_ytdlp
 
 
 def looks_like_playlist_url(url: str) -> bool:
+    # Plain substring checks; no need to fully parse the URL for this question.
+    # The scheme is case-insensitive, matching looks_like_url.
+    return url[:8].lower().startswith(("http://", "https://")) and ("list=" in url or "/playlist" in url)
+
+
+def _cache_path(url: str) -> Path:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return Path.home() / PLAYLIST_CACHE_DIR_NAME / f"{key}.json"
+
+
+def _load_cached_info(url: str) -> Optional[Dict]:
+    """Return the cached minimal info for `url`, or None if missing/expired.
+
+    Expired files are removed so the cache directory doesn't grow forever.
+    """
     try:
-        from urllib.parse import urlparse
-        p = urlparse(url)
-        return "list=" in (p.query or "") or "/playlist" in (p.path or "")
+        path = _cache_path(url)
+        if (time.time() - path.stat().st_mtime) > PLAYLIST_CACHE_TTL_SEC:
+            path.unlink(missing_ok=True)
+            return None
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else None
     except Exception:
-        return False
+        return None
 
 
-def plan_downloads(urls: List[str], expand_playlist: bool) -> List[Dict]:
+def _store_cached_info(url: str, info: Dict) -> Dict:
+    """Reduce `info` to the fields the planner uses, persist and return it.
+
+    Results without entries are returned but not persisted, so a transient
+    empty response is not pinned for the whole cache TTL.
+    """
+    minimal = {
+        "_type": info.get("_type"),
+        "title": info.get("title"),
+        "entries": [
+            {"url": e.get("url"), "title": e.get("title")}
+            for e in (info.get("entries") or [])
+            if isinstance(e, dict)
+        ],
+    }
+    if not minimal["entries"]:
+        return minimal
     try:
-        import importlib
-        ytdlp = importlib.import_module("yt_dlp")
+        path = _cache_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(minimal, f)
     except Exception:
-        ytdlp = None
+        pass
+    return minimal
+
+
+def plan_downloads(urls: List[str], expand_playlist: bool, refresh: bool = False) -> List[Dict]:
+    """Expand `urls` into download tasks.
 
+    Args:
+        urls: Input URLs.
+        expand_playlist: When True, playlist URLs are expanded into entries.
+        refresh: Bypass the on-disk playlist cache and re-fetch metadata.
+    """
+    ytdlp = get_ytdlp()
     tasks: List[Dict] = []
     if ytdlp is None:
         return [{"url": u} for u in urls]
@@ -34,28 +91,31 @@ def plan_downloads(urls: List[str], expand_playlist: bool) -> List[Dict]:
             tasks.append({"url": u})
             continue
         try:
-            opts = {"quiet": True, "skip_download": True, "noplaylist": False, "extract_flat": "in_playlist"}
-            with ytdlp.YoutubeDL(opts) as ydl:
-                info = ydl.extract_info(u, download=False)
+            info = None if refresh else _load_cached_info(u)
+            if info is None:
+                opts = {"quiet": True, "skip_download": True, "noplaylist": False, "extract_flat": "in_playlist"}
+                with ytdlp.YoutubeDL(opts) as ydl:
+                    info = ydl.extract_info(u, download=False)
+                if isinstance(info, dict):
+                    info = _store_cached_info(u, info)
             if isinstance(info, dict) and info.get("_type") == "playlist" and info.get("entries"):
                 playlist_batch_index += 1
-                entries = [e for e in (info.get("entries") or []) if isinstance(e, dict) and e.get("url")]
-                from .utils import sanitize_filename
+                entries = [e for e in info["entries"] if isinstance(e, dict) and e.get("url")]
                 pl_title = sanitize_filename(info.get("title") or "Playlist")
                 pl_count = len(entries)
-                for i, e in enumerate(entries, start=1):
-                    tasks.append({
-                        "url": e.get("url"),
+                tasks.extend(
+                    {
+                        "url": e["url"],
                         "pl_title": pl_title,
                         "pl_index": i,
                         "pl_count": pl_count,
                         "entry_title": e.get("title"),
                         "pl_batch_index": playlist_batch_index,
-                    })
+                    }
+                    for i, e in enumerate(entries, start=1)
+                )
             else:
                 tasks.append({"url": u})
         except Exception:
             tasks.append({"url": u})
     return tasks
-
-
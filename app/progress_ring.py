@@ -0,0 +1,83 @@
+"""Bounded ring buffer for worker → UI progress messages.
+
+Multiple producers, one consumer. Producers are serialized with a small
+lock because yt-dlp may invoke progress hooks from its fragment-download
+threads. The UI thread is the only consumer and never takes that lock:
+under the GIL a single attribute store is atomic, so publishing an item
+before advancing `_head` (producer) and clearing a slot before advancing
+`_tail` (consumer) is enough.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Optional
+
+
+class ProgressRing:
+    """Fixed-capacity FIFO with non-blocking get and an overflow policy.
+
+    Args:
+        capacity: Number of slots; rounded up to a power of two.
+        is_droppable: Predicate for items that may be discarded when the ring
+            is full (e.g. idempotent progress snapshots). Other items wait
+            for the consumer to free a slot.
+    """
+
+    def __init__(self, capacity: int = 256, is_droppable: Optional[Callable[[Any], bool]] = None):
+        size = 1
+        while size < max(2, int(capacity)):
+            size <<= 1
+        self._buf: list[Any] = [None] * size
+        self._mask = size - 1
+        self._size = size
+        self._head = 0  # next slot to write; only producers advance it
+        self._tail = 0  # next slot to read; only the consumer advances it
+        self._put_lock = threading.Lock()
+        # Cleared by a producer that found the ring full; set by the consumer
+        # once it frees a slot
+        self._space = threading.Event()
+        self._space.set()
+        self._is_droppable = is_droppable
+
+    def try_put(self, item: Any) -> bool:
+        """Append `item` if there is room. Returns False when full."""
+        with self._put_lock:
+            head = self._head
+            if head - self._tail >= self._size:
+                return False
+            self._buf[head & self._mask] = item
+            self._head = head + 1
+            return True
+
+    def put(self, item: Any) -> bool:
+        """Append `item`, dropping droppable items when the ring is full.
+
+        Non-droppable items block until the consumer frees a slot. Returns
+        False only if a droppable item was discarded.
+        """
+        while not self.try_put(item):
+            if self._is_droppable is not None and self._is_droppable(item):
+                return False
+            self._space.clear()
+            # Re-check after clearing so a slot freed in between isn't missed
+            if self.try_put(item):
+                break
+            self._space.wait()
+        return True
+
+    def try_get(self) -> Any:
+        """Pop the oldest item, or return None when empty. Consumer only."""
+        tail = self._tail
+        if tail == self._head:
+            return None
+        idx = tail & self._mask
+        item = self._buf[idx]
+        self._buf[idx] = None
+        self._tail = tail + 1
+        if not self._space.is_set():
+            self._space.set()
+        return item
+
+    def __len__(self) -> int:
+        return self._head - self._tail
@@ -1,138 +1,188 @@
 """Progress queue handling logic extracted from the main UI class.
 
 This module centralizes the draining of the background progress queue and
-the updates of Tkinter widgets. The main UI calls `process_progress_queue(self)`
-periodically via `root.after`.
+the updates of Tkinter widgets. The main UI starts polling with
+`schedule_progress_poll(self)`; each poll reschedules itself via `root.after`,
+quickly while a download runs and slowly when idle.
 """
 
 from __future__ import annotations
 
-import queue
+import threading
 from typing import Any
 
-from .config import PROGRESS_POLL_MS
+from .config import PROGRESS_POLL_MS, PROGRESS_IDLE_POLL_MS, PROGRESS_MAX_BATCH
 
 
-def process_progress_queue(app: Any) -> None:
+def assert_main_thread() -> None:
+    """Assert (when assertions are enabled) that Tk is only touched from the main thread."""
+    assert threading.current_thread() is threading.main_thread(), "Tk accessed from a worker thread"
+
+
+def _coalesce(app: Any, batch: list[dict]) -> list[dict]:
+    """Drop superseded snapshots from a drained batch, preserving order.
+
+    Only the last `progress` item and the last `label` per `which` are kept
+    (at the position of that last occurrence); `status` and `done` items are
+    all kept. Log lines carried by dropped progress items are still logged.
+    """
+    seen: set = set()
+    kept: list[dict] = []
+    for item in reversed(batch):
+        typ = item.get("type")
+        if typ == "progress":
+            key: Any = "progress"
+        elif typ == "label":
+            key = ("label", item.get("which"))
+        else:
+            key = None
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(item)
+    kept.reverse()
+    for item in batch:
+        if item.get("type") == "progress":
+            log_line = item.get("log_line")
+            if log_line:
+                app._log(log_line)
+    return kept
+
+
+def _as_float(value: Any) -> float:
     try:
-        while True:
-            item = app.progress_q.get_nowait()
-            if item.get("type") == "progress":
-                try:
-                    overall_val = float(item.get("value", 0) or 0)
-                except Exception:
-                    overall_val = 0.0
-                app.overall_progress.configure(value=overall_val)
-                item_pct = item.get("percent")
-                if item_pct is not None:
-                    try:
-                        app.item_progress.configure(value=float(item_pct))
-                    except Exception:
-                        pass
-                pct = item.get("percent")
-                speed = item.get("speed_human")
-                eta = item.get("eta_human")
-                if pct is None and "value" in item:
-                    try:
-                        pct = float(item.get("value") or 0)
-                    except Exception:
-                        pct = 0
-                if pct is not None:
-                    pct_text = f"{pct:.1f}%"
-                    app.stat_pct_var.set(pct_text)
-                    try:
-                        c = "#6aa84f" if float(pct) >= 100.0 else "#ffd166"
-                        app.stat_pct_lbl.configure(foreground=c)
-                    except Exception:
-                        pass
-                else:
-                    app.stat_pct_var.set("")
-                app.stat_speed_var.set((f"@ {speed}" if speed else ""))
-                app.stat_eta_var.set((f"in ETA {eta}" if eta else ""))
-                app.status_var.set("Downloading")
-                log_line = item.get("log_line")
-                if log_line:
-                    app._log(log_line)
-            elif item.get("type") == "status":
-                app.stat_pct_var.set("")
-                app.stat_speed_var.set("")
-                app.stat_eta_var.set("")
-                text = item.get("text", "")
-                if str(text).startswith("Saved to:"):
-                    pass
-                else:
-                    t = str(text)
-                    if t.lower().startswith("error") or t.startswith("❌"):
-                        try:
-                            app.warn_var.set(f"❌ {t.replace('Error:', '').strip()}")
-                        except Exception:
-                            app.warn_var.set(f"❌ {t}")
-                        app.status_var.set(f"❌ {t}")
-                    elif t.lower().startswith("skipping") or t.startswith("⚠️"):
-                        app.warn_var.set(f"⚠️ {t}")
-                    else:
-                        app.status_var.set(t)
-            elif item.get("type") == "label":
-                if item.get("which") == "overall":
-                    txt = item.get("text", "")
-                    try:
-                        app.overall_label_var.set(txt)
-                    except Exception:
-                        pass
-                elif item.get("which") == "file":
-                    try:
-                        app.current_item_var.set(item.get("text", ""))
-                    except Exception:
-                        pass
-                elif item.get("which") == "current_item":
-                    try:
-                        app.current_item_var.set(item.get("text", ""))
-                        if not getattr(app, "_item_widgets_packed", False):
-                            try:
-                                app.status_row.pack_forget()
-                            except Exception:
-                                pass
-                            try:
-                                app.current_item_label.pack(padx=12, pady=(6, 2), anchor="w")
-                            except Exception:
-                                pass
-                            try:
-                                app.item_progress.pack(fill="x", padx=12)
-                            except Exception:
-                                pass
-                            try:
-                                app.status_var.set("")
-                                app.status_row.pack(padx=12, pady=(6, 0), anchor="w")
-                            except Exception:
-                                pass
-                            try:
-                                app.saved_to_label.pack(padx=12, pady=(6, 0), anchor="w")
-                            except Exception:
-                                pass
-                            try:
-                                app.warn_label.pack(padx=12, pady=(4, 0), anchor="w")
-                            except Exception:
-                                pass
-                            app._item_widgets_packed = True
-                    except Exception:
-                        pass
-                elif item.get("which") == "saved_to":
-                    text = item.get("text", "")
-                    try:
-                        app._saved_to_full_path = text.split("Saved to:", 1)[1].strip()
-                    except Exception:
-                        app._saved_to_full_path = None
-                    app.saved_to_var.set(text)
-                elif item.get("which") == "clear_warn":
-                    app.warn_var.set("")
-            elif item.get("type") == "done":
-                app.downloading = False
-                app.download_btn.config(state="normal")
-                if hasattr(app, 'cancel_btn'):
-                    app.cancel_btn.config(state="disabled")
-    except queue.Empty:
-        pass
-    finally:
-        app.root.after(PROGRESS_POLL_MS, lambda: process_progress_queue(app))
+        return float(value or 0)
+    except Exception:
+        return 0.0
+
+
+def _collect_progress(app: Any, item: dict, ops: list) -> None:
+    value = _as_float(item.get("value"))
+    ops.append((app.overall_progress.configure, {"value": value}))
+    pct = item.get("percent")
+    if pct is not None:
+        pct = _as_float(pct)
+        ops.append((app.item_progress.configure, {"value": pct}))
+    elif "value" in item:
+        pct = value
+    if pct is not None:
+        ops.append((app.stat_pct_var.set, {"value": f"{pct:.1f}%"}))
+        ops.append((app.stat_pct_lbl.configure, {"foreground": "#6aa84f" if pct >= 100.0 else "#ffd166"}))
+    else:
+        ops.append((app.stat_pct_var.set, {"value": ""}))
+    speed = item.get("speed_human")
+    eta = item.get("eta_human")
+    ops.append((app.stat_speed_var.set, {"value": f"@ {speed}" if speed else ""}))
+    ops.append((app.stat_eta_var.set, {"value": f"in ETA {eta}" if eta else ""}))
+    ops.append((app.status_var.set, {"value": "Downloading"}))
+
+
+def _collect_status(app: Any, item: dict, ops: list) -> None:
+    ops.append((app.stat_pct_var.set, {"value": ""}))
+    ops.append((app.stat_speed_var.set, {"value": ""}))
+    ops.append((app.stat_eta_var.set, {"value": ""}))
+    t = str(item.get("text", ""))
+    if t.startswith("Saved to:"):
+        return
+    if t.lower().startswith("error") or t.startswith("❌"):
+        ops.append((app.warn_var.set, {"value": f"❌ {t.replace('Error:', '').strip()}"}))
+        ops.append((app.status_var.set, {"value": f"❌ {t}"}))
+    elif t.lower().startswith("skipping") or t.startswith("⚠️"):
+        ops.append((app.warn_var.set, {"value": f"⚠️ {t}"}))
+    else:
+        ops.append((app.status_var.set, {"value": t}))
+
 
+def _collect_label(app: Any, item: dict, ops: list) -> None:
+    which = item.get("which")
+    text = item.get("text", "")
+    if which == "overall":
+        ops.append((app.overall_label_var.set, {"value": text}))
+    elif which == "file":
+        ops.append((app.current_item_var.set, {"value": text}))
+    elif which == "current_item":
+        ops.append((app.current_item_var.set, {"value": text}))
+        if not getattr(app, "_item_widgets_packed", False):
+            # First titled item: reveal the per-item widgets in display order
+            ops.append((app.status_row.pack_forget, {}))
+            ops.append((app.current_item_label.pack, {"padx": 12, "pady": (6, 2), "anchor": "w"}))
+            ops.append((app.item_progress.pack, {"fill": "x", "padx": 12}))
+            ops.append((app.status_var.set, {"value": ""}))
+            ops.append((app.status_row.pack, {"padx": 12, "pady": (6, 0), "anchor": "w"}))
+            ops.append((app.saved_to_label.pack, {"padx": 12, "pady": (6, 0), "anchor": "w"}))
+            ops.append((app.warn_label.pack, {"padx": 12, "pady": (4, 0), "anchor": "w"}))
+            app._item_widgets_packed = True
+    elif which == "saved_to":
+        _, sep, path = text.partition("Saved to:")
+        app._saved_to_full_path = path.strip() if sep else None
+        ops.append((app.saved_to_var.set, {"value": text}))
+    elif which == "clear_warn":
+        ops.append((app.warn_var.set, {"value": ""}))
+    elif which == "ffmpeg_status":
+        ops.append((app.ffmpeg_status_var.set, {"value": text}))
 
+
+def _collect_done(app: Any, item: dict, ops: list) -> None:
+    app.downloading = False
+    ops.append((app.download_btn.config, {"state": "normal"}))
+    if hasattr(app, 'cancel_btn'):
+        ops.append((app.cancel_btn.config, {"state": "disabled"}))
+
+
+_COLLECTORS = {
+    "progress": _collect_progress,
+    "status": _collect_status,
+    "label": _collect_label,
+    "done": _collect_done,
+}
+
+
+def schedule_progress_poll(app: Any, immediate: bool = False) -> None:
+    """Schedule the next poll, replacing any pending one.
+
+    Args:
+        app: The DownloaderApp instance.
+        immediate: Poll as soon as Tk is idle (e.g. right after a download starts).
+    """
+    pending = getattr(app, "_progress_after_id", None)
+    if pending is not None:
+        try:
+            app.root.after_cancel(pending)
+        except Exception:
+            pass
+    if immediate:
+        app._progress_after_id = app.root.after_idle(process_progress_queue, app)
+    else:
+        delay = PROGRESS_POLL_MS if app.downloading else PROGRESS_IDLE_POLL_MS
+        app._progress_after_id = app.root.after(delay, process_progress_queue, app)
+
+
+def process_progress_queue(app: Any) -> None:
+    assert_main_thread()
+    app._progress_after_id = None
+    try:
+        # Drain what was queued since the last tick (bounded so one tick never
+        # monopolizes Tk), then apply only what survives coalescing
+        batch: list[dict] = []
+        get = app.progress_q.try_get
+        for _ in range(PROGRESS_MAX_BATCH):
+            item = get()
+            if item is None:
+                break
+            batch.append(item)
+        # Turn the batch into (widget method, kwargs) updates, then apply them
+        # in order; each is guarded so one failing widget call can't skip the
+        # rest (e.g. re-enabling the Download button on "done")
+        ops: list = []
+        for item in _coalesce(app, batch):
+            collect = _COLLECTORS.get(item.get("type"))
+            if collect is not None:
+                collect(app, item, ops)
+        for fn, kwargs in ops:
+            try:
+                fn(**kwargs)
+            except Exception:
+                pass
+    finally:
+        schedule_progress_poll(app)
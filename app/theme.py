@@ -6,22 +6,63 @@ light/dark styling to the application widgets in a consistent way.
 
 from __future__ import annotations
 
+import subprocess
+import sys
+import threading
+import time
 from tkinter import Tk, ttk, Text
 
+from .config import THEME_PROBE_TTL_SEC, THEME_POLL_INTERVAL_SEC
 
-def detect_system_dark() -> bool:
-    """Return True if the macOS system appearance is Dark.
 
-    Falls back to False (Light) if detection fails or on non-macOS systems.
-    """
+# (timestamp, is_dark) of the last system appearance probe
+_DARK_CACHE: tuple[float, bool] | None = None
+_poller: threading.Thread | None = None
+
+
+def _probe_system_dark() -> bool:
+    if sys.platform != "darwin":
+        return False
     try:
-        import subprocess
         out = subprocess.check_output(["defaults", "read", "-g", "AppleInterfaceStyle"], stderr=subprocess.STDOUT)
         return b"Dark" in out
     except Exception:
         return False
 
 
+def _poll_system_dark() -> None:
+    global _DARK_CACHE
+    while True:
+        time.sleep(THEME_POLL_INTERVAL_SEC)
+        _DARK_CACHE = (time.time(), _probe_system_dark())
+
+
+def detect_system_dark() -> bool:
+    """Return True if the macOS system appearance is Dark.
+
+    Falls back to False (Light) if detection fails or on non-macOS systems.
+    The result is cached; a background thread keeps it fresh so callers on
+    the UI thread normally avoid spawning `defaults`.
+    """
+    global _DARK_CACHE, _poller
+    # `defaults` only exists on macOS; don't probe or poll anywhere else
+    if sys.platform != "darwin":
+        return False
+    cached = _DARK_CACHE
+    poller_alive = _poller is not None and _poller.is_alive()
+    if cached is not None and (poller_alive or (time.time() - cached[0]) < THEME_PROBE_TTL_SEC):
+        return cached[1]
+    dark = _probe_system_dark()
+    _DARK_CACHE = (time.time(), dark)
+    if not poller_alive:
+        try:
+            _poller = threading.Thread(target=_poll_system_dark, daemon=True)
+            _poller.start()
+        except Exception:
+            _poller = None
+    return dark
+
+
 def apply_theme(root: Tk, text_widget: Text | None, preference: str) -> bool:
     """Apply a light/dark theme to the given Tk root and optional Text widget.
 
@@ -6,8 +6,12 @@ download operations. Uses a queue for thread-safe communication.
 
 from __future__ import annotations
 
-import queue
+import re
+import subprocess
 import threading
+import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Any, cast
 from pathlib import Path
 
@@ -15,15 +19,22 @@ from tkinter import Tk, Text, StringVar, BooleanVar, ttk, filedialog, messagebox
 
 from .dnd_support import DND_TEXT
 
-from .config import DEFAULT_CONTAINER, DEFAULT_RESOLUTION_LABEL, PROGRESS_POLL_MS, SETTINGS_FILE_NAME, DEFAULT_LIMIT_FRAGMENT_CONCURRENCY
+from .config import DEFAULT_CONTAINER, DEFAULT_RESOLUTION_LABEL, PROGRESS_RING_SIZE, SETTINGS_FILE_NAME, SETTINGS_PERSIST_DEBOUNCE_MS, DEFAULT_LIMIT_FRAGMENT_CONCURRENCY, TITLE_PROBE_WORKERS, TITLE_PROBE_TIMEOUT_SEC, LOG_MAX_LINES
 from .ffmpeg_check import check_ffmpeg
-from .utils import looks_like_url, load_settings, save_settings
-from .downloader_service import DownloadContext, download_single, CancelledDownloadError
-from .planner import plan_downloads
+from .utils import looks_like_url, load_settings, save_settings_async, flush_settings
+from .downloader_service import DownloadContext, download_single, open_probe, probe_info, CancelledDownloadError
+from .planner import plan_downloads, looks_like_playlist_url
 from .theme import apply_theme
 from .log_window import show_log_window
 from .quality import configure_quality_widgets_for_format, parse_bitrate_kbps
-from .progress_ui import process_progress_queue
+from .progress_ui import schedule_progress_poll, assert_main_thread
+from .progress_ring import ProgressRing
+
+
+_SPLIT_WS = re.compile(r"\s+")
+_FFMPEG_VERSION_RE = re.compile(r"ffmpeg version\s+([\w\.-]+)")
+_PRIVATE_PREFIX = "[private video]"
+_PRIVATE_EQ = "private video"
 
 
 class DownloaderApp:
@@ -36,7 +47,18 @@ class DownloaderApp:
         self.target_dir = None
         self.downloading = False
         self.cancel_event = threading.Event()
-        self.log_lines: list[str] = []
+        # Title probes are network-bound; prefetch them concurrently. Each pool
+        # thread keeps its own YoutubeDL since instances are not thread-safe.
+        self._title_pool = ThreadPoolExecutor(max_workers=TITLE_PROBE_WORKERS, thread_name_prefix="title-probe")
+        self._probe_local = threading.local()
+        # Probes opened by pool threads during the current batch; closed when it
+        # ends, and the generation bump makes each thread open a fresh one next time
+        self._probe_lock = threading.Lock()
+        self._open_probes: list = []
+        self._probe_gen = 0
+        self.log_lines: deque[str] = deque(maxlen=LOG_MAX_LINES)
+        # Per-chunk download progress is only logged once the log has been viewed
+        self.verbose_log = False
         self.last_error_details: str | None = None
 
         self.settings_path = Path.home() / SETTINGS_FILE_NAME
@@ -44,6 +66,8 @@ class DownloaderApp:
         self.container_var = StringVar(self.root, value=_settings.get("container", DEFAULT_CONTAINER))
         self.resolution_var = StringVar(self.root, value=_settings.get("resolution", DEFAULT_RESOLUTION_LABEL))
         self.expand_playlist_var = BooleanVar(self.root, value=bool(_settings.get("expand_playlist", False)))
+        # Not persisted: bypass the playlist cache for the next run(s) only while checked
+        self.refresh_playlist_var = BooleanVar(self.root, value=False)
         self.limit_fragments_var = BooleanVar(self.root, value=bool(_settings.get("limit_fragments", DEFAULT_LIMIT_FRAGMENT_CONCURRENCY)))
         self.prefer_avc_var = BooleanVar(self.root, value=bool(_settings.get("prefer_avc", True)))
         # Theme preference: Auto / Light / Dark
@@ -55,7 +79,10 @@ class DownloaderApp:
             _pref = "Auto"
         self.theme_var = StringVar(self.root, value=_pref)
 
-        self.progress_q: "queue.Queue[dict]" = queue.Queue()
+        # Kept as a bounded ring rather than queue.SimpleQueue (which is cheaper
+        # per op but unbounded): it caps memory if Tk stalls, and progress
+        # snapshots are idempotent, so they may be dropped on overflow
+        self.progress_q = ProgressRing(PROGRESS_RING_SIZE, is_droppable=lambda ev: ev.get("type") == "progress")
 
         self.ffmpeg_ok = False
         self.ffmpeg_path: str | None = None
@@ -66,9 +93,16 @@ class DownloaderApp:
         # Predefine attributes referenced later
         self._saved_to_full_path: str | None = None
         self.warn_var: StringVar | None = None
+        self._persist_after_id: str | None = None
+        # Last settings known to be on disk, and the last handed to the writer;
+        # a change is skipped only when it matches both
+        self._last_persisted: dict | None = dict(_settings) if _settings else None
+        self._last_queued: dict | None = self._last_persisted
 
         self._build_ui()
-        self.root.after(PROGRESS_POLL_MS, lambda: process_progress_queue(self))
+        self._progress_after_id: str | None = None
+        schedule_progress_poll(self)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self._start_ffmpeg_check()
         # initial theme application
         try:
@@ -187,6 +221,7 @@ class DownloaderApp:
         opt_row2.pack(**pad, anchor="center")
         self.playlist_chk = ttk.Checkbutton(opt_row2, text="Expand playlist", variable=self.expand_playlist_var)
         self.playlist_chk.pack(side="left")
+        ttk.Checkbutton(opt_row2, text="Refresh playlist", variable=self.refresh_playlist_var).pack(side="left", padx=(14, 0))
         self.prefer_avc_chk = ttk.Checkbutton(opt_row2, text="Prefer AVC for MP4", variable=self.prefer_avc_var)
         self.prefer_avc_chk.pack(side="left", padx=(14, 0))
         # Advanced smoother UI toggle
@@ -197,7 +232,7 @@ class DownloaderApp:
         log_row = ttk.Frame(self.root)
         log_row.pack(**pad, anchor="center")
         ttk.Button(log_row, text="Show Log", command=self._show_log_window).pack(side="left")
-        ttk.Button(log_row, text="Re-check FFmpeg", command=self._start_ffmpeg_check).pack(side="left", padx=(8, 0))
+        ttk.Button(log_row, text="Re-check FFmpeg", command=self._recheck_ffmpeg).pack(side="left", padx=(8, 0))
         # Theme preference selector
         ttk.Label(log_row, text="Theme:").pack(side="left", padx=(8, 4))
         ttk.OptionMenu(log_row, self.theme_var, self.theme_var.get(), "Auto", "Light", "Dark", command=lambda _=None: apply_theme(self.root, self.url_text, self.theme_var.get())).pack(side="left")
@@ -208,7 +243,15 @@ class DownloaderApp:
         except Exception:
             pass
 
+    def _recheck_ffmpeg(self):
+        assert_main_thread()
+        # Drop the memoized result so the user sees a fresh detection
+        check_ffmpeg.cache_clear()
+        self.ffmpeg_status_var.set("FFmpeg: checking…")
+        self._start_ffmpeg_check()
+
     def _ffmpeg_check_worker(self):
+        # Runs off the main thread: the status text goes to the UI via progress_q
         ok, ffmpeg, ffprobe, version = check_ffmpeg()
         self.ffmpeg_ok = ok
         self.ffmpeg_path = ffmpeg
@@ -217,8 +260,7 @@ class DownloaderApp:
             # Extract short version like v6.1
             short_v = ""
             try:
-                import re
-                m = re.search(r"ffmpeg version\s+([\w\.-]+)", version or "")
+                m = _FFMPEG_VERSION_RE.search(version or "")
                 if m:
                     ver = m.group(1)
                     # keep major.minor if possible
@@ -230,15 +272,17 @@ class DownloaderApp:
             except Exception:
                 short_v = ""
             label = f"FFmpeg OK — {short_v}" if short_v else "FFmpeg OK"
-            self.ffmpeg_status_var.set(label)
         else:
             # Basic categorization
             emoji = "⚠️" if (ffmpeg or ffprobe) else "❌"
-            self.ffmpeg_status_var.set(f"FFmpeg check {emoji} - Click 'Re-check FFmpeg'.")
+            label = f"FFmpeg check {emoji} - Click 'Re-check FFmpeg'."
+        self.progress_q.put({"type": "label", "which": "ffmpeg_status", "text": label})
 
     def _on_drop(self, event):
         data = event.data.strip().replace("{", "").replace("}", "")
-        self.url_text.insert("end", ("\n" if self.url_text.get("1.0", "end").strip() else "") + data)
+        # Index comparison runs in Tcl; no need to copy the whole buffer out
+        has_content = self.url_text.compare("end-1c", "!=", "1.0")
+        self.url_text.insert("end", ("\n" if has_content else "") + data)
 
     def _choose_folder(self):
         folder = filedialog.askdirectory(title="Choose download folder")
@@ -247,22 +291,21 @@ class DownloaderApp:
             self.dir_label_var.set(str(self.target_dir))
             try:
                 # persist folder
-                self._persist_settings()
+                self._schedule_persist()
             except Exception:
                 pass
 
-    def _collect_urls(self):
+    def _collect_urls(self) -> list[tuple[str, bool]]:
+        """Return (url, looks_like_playlist) for each URL in the text box."""
         raw = self.url_text.get("1.0", "end").strip()
-        import re
-        items = re.split(r"\s+", raw)
-        urls = [s for s in items if looks_like_url(s)]
-        return urls
+        return [(s, looks_like_playlist_url(s)) for s in _SPLIT_WS.split(raw) if looks_like_url(s)]
 
     def _start_download(self):
+        assert_main_thread()
         if self.downloading:
             return
-        urls = self._collect_urls()
-        if not urls:
+        collected = self._collect_urls()
+        if not collected:
             messagebox.showerror("Missing URLs", "Please paste or drop at least one valid URL.")
             return
         if not self.target_dir:
@@ -270,8 +313,7 @@ class DownloaderApp:
             return
         try:
             if not self.expand_playlist_var.get():
-                from .planner import looks_like_playlist_url
-                if any(looks_like_playlist_url(u) for u in urls):
+                if any(is_pl for _, is_pl in collected):
                     if messagebox.askyesno("Playlist detected", "One or more URLs look like playlists. Download all items?"):
                         self.expand_playlist_var.set(True)
         except Exception:
@@ -311,7 +353,19 @@ class DownloaderApp:
             pass
         self.status_var.set("Preparing...")
         self.cancel_event.clear()
-        threading.Thread(target=self._download_worker, args=(urls,), daemon=True).start()
+        # Switch the progress poll to the fast cadence right away
+        schedule_progress_poll(self, immediate=True)
+        # The worker never touches Tk; hand it a plain snapshot of the options
+        settings_snapshot = {
+            "container": self.container_var.get(),
+            "resolution": self.resolution_var.get(),
+            "prefer_avc": bool(self.prefer_avc_var.get()),
+            "limit_fragments": bool(self.limit_fragments_var.get()),
+            "expand_playlist": bool(self.expand_playlist_var.get()),
+            "refresh_playlist": bool(self.refresh_playlist_var.get()),
+        }
+        urls = [u for u, _ in collected]
+        threading.Thread(target=self._download_worker, args=(urls, settings_snapshot), daemon=True).start()
 
     def _cancel_download(self):
         if not self.downloading:
@@ -321,17 +375,120 @@ class DownloaderApp:
 
     # legacy batch label method removed
 
-    def _download_worker(self, urls):
+    def _probe_title(self, url: str) -> tuple[str | None, bool]:
+        """Return (title, private_detected) for `url`. Runs on the title pool."""
+        local = self._probe_local
+        if getattr(local, "gen", None) != self._probe_gen:
+            ydl = open_probe()
+            with self._probe_lock:
+                local.ydl, local.gen = ydl, self._probe_gen
+                if ydl is not None:
+                    self._open_probes.append(ydl)
+        ydl = local.ydl
+        if ydl is None:
+            return None, False
         try:
-            planned = plan_downloads(urls, self.expand_playlist_var.get())
+            # Cached, so download_single reuses this probe as well
+            info = probe_info(url, ydl=ydl)
+        except Exception as e:
+            return None, "Private video" in str(e)
+        return (info.get("title") if isinstance(info, dict) else None), False
+
+    def _wait_title(self, future: Future) -> tuple[str | None, bool]:
+        # Wait in short slices so a cancel is noticed while a probe is slow
+        waited = 0.0
+        while not self.cancel_event.is_set() and waited < TITLE_PROBE_TIMEOUT_SEC:
+            try:
+                return future.result(timeout=0.2)
+            except FutureTimeoutError:
+                waited += 0.2
+            except Exception:
+                break
+        return None, False
+
+    def _close_probes(self, running: list[Future]) -> None:
+        """Close the probe instances opened for the batch that just ended.
+
+        Args:
+            running: Probes that could not be cancelled; their instances are
+                closed only once the last of them finishes.
+        """
+        with self._probe_lock:
+            probes, self._open_probes = self._open_probes, []
+            self._probe_gen += 1
+
+        def close_all() -> None:
+            for ydl in probes:
+                try:
+                    ydl.close()
+                except Exception:
+                    pass
+
+        if not running:
+            close_all()
+            return
+        remaining = [len(running)]
+        count_lock = threading.Lock()
+
+        def on_done(_future: Future) -> None:
+            with count_lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                close_all()
+
+        for future in running:
+            future.add_done_callback(on_done)
+
+    def _download_worker(self, urls, settings_snapshot: dict):
+        futures: dict[int, Future] = {}
+        # Output names handed out during this batch, shared by every item
+        reserved_names: set[str] = set()
+        # Runs off the main thread: options come from the snapshot, never from Tk vars
+        merge_fmt = settings_snapshot.get("container")
+        res_label = settings_snapshot.get("resolution")
+        prefer_avc = settings_snapshot.get("prefer_avc", False)
+        limit_frags = settings_snapshot.get("limit_fragments", False)
+        expand_playlist = settings_snapshot.get("expand_playlist", False)
+        refresh_playlist = settings_snapshot.get("refresh_playlist", False)
+        try:
+            planned = plan_downloads(urls, expand_playlist, refresh=refresh_playlist)
             total = len(planned)
+            # Next item whose title probe has not been submitted yet
+            next_probe = 1
+            # Overall percent contributed by each item
+            inv_total = 100.0 / max(1, total)
             # As soon as totals are known, surface the overall label with unknown current index
             if total:
                 self.progress_q.put({"type": "label", "which": "overall", "text": f"Total items ? / {total}"})
+            # Download options don't change mid-run, so one context serves every item
+            br_kbps = None
+            try:
+                if (merge_fmt or "").lower() == "mp3":
+                    br_kbps = parse_bitrate_kbps(res_label) or 320
+            except Exception:
+                br_kbps = None
+            dl_ctx = DownloadContext(
+                target_dir=self.target_dir,
+                merge_format=merge_fmt,
+                prefer_avc_for_mp4=prefer_avc,
+                resolution_label=res_label,
+                ffmpeg_path=self.ffmpeg_path,
+                limit_fragment_concurrency=bool(limit_frags),
+                audio_bitrate_kbps=br_kbps,
+                reserved_names=reserved_names,
+            )
             for idx, task in enumerate(planned, start=1):
                 if self.cancel_event.is_set():
                     self.progress_q.put({"type": "status", "text": "Cancelled"})
                     break
+                # Keep title probes running for this item and the next few only
+                window_end = min(total, idx + TITLE_PROBE_WORKERS)
+                while next_probe <= window_end:
+                    ahead = planned[next_probe - 1]
+                    if isinstance(ahead, dict) and not ahead.get("entry_title"):
+                        futures[next_probe] = self._title_pool.submit(self._probe_title, ahead.get("url"))
+                    next_probe += 1
                 # Update overall items label (displayed as "Total items X / Y")
                 self.progress_q.put({"type": "label", "which": "overall", "text": f"Total items {idx} / {total}"})
                 try:
@@ -347,23 +504,18 @@ class DownloaderApp:
                 # Probe title for individual links when not provided
                 title = entry_title
                 private_detected = False
-                if not title:
-                    try:
-                        import importlib as _il
-                        _ytdlp = _il.import_module("yt_dlp")
-                        _opts = {"quiet": True, "skip_download": True, "noplaylist": True}
-                        with _ytdlp.YoutubeDL(_opts) as _ydl:
-                            _info = _ydl.extract_info(task.get("url"), download=False)
-                        if isinstance(_info, dict):
-                            title = _info.get("title") or title
-                    except Exception as _e:
-                        if "Private video" in str(_e):
-                            private_detected = True
-                        # otherwise ignore; title stays None
+                if not title and idx in futures:
+                    title, private_detected = self._wait_title(futures[idx])
+                    # The wait gives up early on Cancel; don't start this item
+                    if self.cancel_event.is_set():
+                        self.progress_q.put({"type": "status", "text": "Cancelled"})
+                        break
 
                 # Determine if entry is private based on known markers
                 title_str = str(title or "").strip()
-                if (title_str.lower().startswith("[private video]") or title_str.lower() == "private video"):
+                # Both markers fit in the first 16 chars; fold only that slice
+                low = title_str[:16].casefold()
+                if low.startswith(_PRIVATE_PREFIX) or low == _PRIVATE_EQ:
                     private_detected = True
 
                 # Build context-aware label text
@@ -384,60 +536,38 @@ class DownloaderApp:
                         "text": f"Skipping item {idx} / {total} - private video: {title or 'Unknown'}",
                     })
                     # Advance overall progress as if this item completed
-                    try:
-                        overall_after_skip = (float(idx) / max(1, float(total))) * 100.0
-                    except Exception:
-                        overall_after_skip = 0.0
-                    self.progress_q.put({"type": "progress", "value": overall_after_skip, "text": ""})
+                    self.progress_q.put({"type": "progress", "value": idx * inv_total, "text": ""})
                     continue
 
-                # Derive audio bitrate when mp3 is selected
-                br_kbps = None
-                try:
-                    if (self.container_var.get() or "").lower() == "mp3":
-                        br_kbps = parse_bitrate_kbps(self.resolution_var.get()) or 320
-                except Exception:
-                    br_kbps = None
-
-                dl_ctx = DownloadContext(
-                    target_dir=self.target_dir,
-                    merge_format=self.container_var.get(),
-                    prefer_avc_for_mp4=self.prefer_avc_var.get(),
-                    resolution_label=self.resolution_var.get(),
-                    ffmpeg_path=self.ffmpeg_path,
-                    limit_fragment_concurrency=bool(self.limit_fragments_var.get()),
-                    audio_bitrate_kbps=br_kbps,
-                )
-                current_index = idx
-                current_total = total
-                def post_progress(ev: dict):
-                    if ev.get("type") == "progress":
+                # Per-item state is bound as defaults so lookups are plain locals
+                def post_progress(ev: dict, _idx=idx, _put=self.progress_q.put, _inv=inv_total):
+                    typ = ev.get("type")
+                    if typ == "progress":
                         # Map item progress to overall progress across all items
-                        try:
-                            item_pct = float(ev.get("value", 0) or 0)
-                        except Exception:
-                            item_pct = 0.0
-                        overall = (((current_index - 1) + (item_pct / 100.0)) / max(1, current_total)) * 100.0
+                        item_pct = ev.get("value", 0) or 0
                         ev = dict(ev)
-                        ev["value"] = overall
-                        self.progress_q.put(ev)
-                    elif ev.get("type") == "status":
+                        ev["value"] = ((_idx - 1) + item_pct * 0.01) * _inv
+                        _put(ev)
+                    elif typ == "status":
                         # also capture saved-to path
                         text = ev.get("text") or ""
                         if text.startswith("Saved to:"):
-                            self.progress_q.put({"type": "label", "which": "saved_to", "text": text})
-                        self.progress_q.put(ev)
+                            _put({"type": "label", "which": "saved_to", "text": text})
+                        _put(ev)
 
-                download_single(task.get("url"), dl_ctx, post_progress, ctx_entry=task, is_cancelled=self.cancel_event.is_set)
+                download_single(task.get("url"), dl_ctx, post_progress, ctx_entry=task, is_cancelled=self.cancel_event.is_set,
+                                log_enabled=lambda: self.verbose_log)
             self.progress_q.put({"type": "status", "text": "All done"})
         except CancelledDownloadError:
             self.progress_q.put({"type": "status", "text": "Cancelled"})
         except Exception as e:
-            import traceback
             self.last_error_details = traceback.format_exc()
             self._log(f"Error: {e}")
             self.progress_q.put({"type": "status", "text": f"Error: {e}"})
         finally:
+            # Drop prefetches that are no longer needed (cancel/error)
+            running = [f for f in futures.values() if not f.cancel() and not f.done()]
+            self._close_probes(running)
             self.progress_q.put({"type": "done"})
 
     def _rebuild_quality_menu_for_format(self, merge_fmt: str):
@@ -472,27 +602,60 @@ class DownloaderApp:
                     self.prefer_avc_chk.state(["disabled"])  # disable
                 except Exception:
                     pass
-            self._persist_settings()
+            self._schedule_persist()
         except Exception:
             pass
 
     def _on_resolution_change(self):
         try:
-            self._persist_settings()
+            self._schedule_persist()
         except Exception:
             pass
 
     def _attach_var_traces(self):
         try:
-            self.container_var.trace_add('write', lambda *_: self._persist_settings())
-            self.resolution_var.trace_add('write', lambda *_: self._persist_settings())
-            self.expand_playlist_var.trace_add('write', lambda *_: self._persist_settings())
-            self.prefer_avc_var.trace_add('write', lambda *_: self._persist_settings())
-            self.limit_fragments_var.trace_add('write', lambda *_: self._persist_settings())
+            self.container_var.trace_add('write', lambda *_: self._schedule_persist())
+            self.resolution_var.trace_add('write', lambda *_: self._schedule_persist())
+            self.expand_playlist_var.trace_add('write', lambda *_: self._schedule_persist())
+            self.prefer_avc_var.trace_add('write', lambda *_: self._schedule_persist())
+            self.limit_fragments_var.trace_add('write', lambda *_: self._schedule_persist())
+        except Exception:
+            pass
+
+    def _schedule_persist(self):
+        # Trailing debounce: one write per burst of UI changes
+        try:
+            if self._persist_after_id is not None:
+                self.root.after_cancel(self._persist_after_id)
+            self._persist_after_id = self.root.after(SETTINGS_PERSIST_DEBOUNCE_MS, self._do_persist_settings)
+        except Exception:
+            pass
+
+    def _flush_persist(self):
+        """Write any pending settings change immediately."""
+        if self._persist_after_id is None:
+            return
+        try:
+            self.root.after_cancel(self._persist_after_id)
         except Exception:
             pass
+        self._do_persist_settings()
 
-    def _persist_settings(self):
+    def _on_close(self):
+        # Stop the batch and drop queued title probes so exit doesn't wait on them
+        self.cancel_event.set()
+        try:
+            self._title_pool.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+        self._flush_persist()
+        # The writer thread is a daemon; make sure the last write hits disk
+        flush_settings()
+        self.root.destroy()
+
+    def _do_persist_settings(self):
+        assert_main_thread()
+        self._persist_after_id = None
         try:
             data = {
                 "container": (self.container_var.get() or "mkv"),
@@ -503,10 +666,17 @@ class DownloaderApp:
                 "last_folder": str(self.target_dir) if self.target_dir else None,
                 "theme": (self.theme_var.get() if hasattr(self, 'theme_var') else "Auto"),
             }
-            save_settings(self.settings_path, data)
+            if data == self._last_persisted and data == self._last_queued:
+                return
+            self._last_queued = data
+            save_settings_async(self.settings_path, data, on_saved=self._on_settings_saved)
         except Exception:
             pass
 
+    def _on_settings_saved(self, data: dict) -> None:
+        # Runs on the settings writer thread; a plain attribute store, no Tk
+        self._last_persisted = data
+
     def _on_open_saved(self, _event=None):
         try:
             text = self.saved_to_var.get() or ""
@@ -514,36 +684,31 @@ class DownloaderApp:
                 path = text.split("Saved to:", 1)[1].strip()
                 p = Path(path)
                 if p.exists():
-                    import subprocess as _sp
-                    _sp.Popen(["open", "-R", str(p)])
+                    subprocess.Popen(["open", "-R", str(p)])
         except Exception:
             pass
 
     def _on_open_folder(self, _event=None):
         try:
             if self.target_dir:
-                import subprocess as _sp
-                _sp.Popen(["open", str(self.target_dir)])
+                subprocess.Popen(["open", str(self.target_dir)])
         except Exception:
             pass
 
     def _apply_theme(self):
         try:
             apply_theme(self.root, self.url_text, self.theme_var.get())
-            self._persist_settings()
+            self._schedule_persist()
         except Exception:
             pass
 
     def _log(self, line: str):
-        try:
-            self.log_lines.append(line)
-            if len(self.log_lines) > 1000:
-                del self.log_lines[: len(self.log_lines) - 1000]
-        except Exception:
-            pass
+        # Bounded deque: the oldest lines fall off automatically
+        self.log_lines.append(line)
 
     def _show_log_window(self):
-        show_log_window(self.root, self.log_lines, self.last_error_details)
+        self.verbose_log = True
+        show_log_window(self.root, list(self.log_lines), self.last_error_details)
 
 
 def create_root():
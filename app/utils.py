@@ -2,44 +2,77 @@
     and simple JSON settings persistence.
 """
 
+import os
+import queue
 import re
+import threading
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Callable, Optional
 import json
 
 
 INVALID_FS_CHARS = r"\\/:*?\"<>|"
 
+# Invalid filesystem characters and line breaks/tabs all become spaces
+_SANITIZE_TABLE = str.maketrans({c: " " for c in INVALID_FS_CHARS + "\r\n\t"})
+_WS_RE = re.compile(r"\s+")
+
 
 def sanitize_filename(name: str) -> str:
     """Return a filesystem-safe filename (without extension)."""
     if not name:
         return ""
-    name = re.sub(r"[\r\n\t]", " ", name)
-    name = "".join((c if c not in INVALID_FS_CHARS else " ") for c in name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = name.translate(_SANITIZE_TABLE)
+    name = _WS_RE.sub(" ", name).strip()
     return name or ""
 
 
-def ensure_unique_path(base_path: Path, ext: str) -> Path:
-    """Return a unique path by appending (1), (2)... if needed."""
-    candidate = base_path.with_suffix(f".{ext}")
-    if not candidate.exists():
-        return candidate
-    i = 1
-    while True:
-        candidate = base_path.with_name(f"{base_path.name} ({i})").with_suffix(f".{ext}")
-        if not candidate.exists():
-            return candidate
-        i += 1
+def ensure_unique_path(base_path: Path, ext: str, reserved: set[str] | None = None) -> Path:
+    """Return a unique path by appending (1), (2)... if needed.
+
+    Paths in `reserved` (already handed out earlier in the batch) count as
+    taken without a filesystem check; the returned path is added to it.
+    Suffixes are probed by doubling and then bisecting, so N existing
+    duplicates cost O(log N) checks instead of N.
+    """
+    def candidate(i: int) -> Path:
+        if i == 0:
+            return base_path.with_suffix(f".{ext}")
+        return base_path.with_name(f"{base_path.name} ({i})").with_suffix(f".{ext}")
+
+    def taken(i: int) -> bool:
+        p = candidate(i)
+        return (reserved is not None and str(p) in reserved) or p.exists()
+
+    # Invariant: suffix `lo` is taken, `hi` is free
+    lo, hi = 0, 0
+    if taken(0):
+        hi = 1
+        while taken(hi):
+            lo, hi = hi, hi * 2
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if taken(mid):
+                lo = mid
+            else:
+                hi = mid
+    result = candidate(hi)
+    if reserved is not None:
+        reserved.add(str(result))
+    return result
 
 
 def looks_like_url(s: str) -> bool:
     s = (s or "").strip()
-    if not s:
+    # http(s) scheme (case-insensitive) followed by a non-empty host
+    head = s[:8].lower()
+    if head.startswith("https://"):
+        host_at = 8
+    elif head.startswith("http://"):
+        host_at = 7
+    else:
         return False
-    p = urlparse(s)
-    return p.scheme in {"http", "https"} and bool(p.netloc)
+    return len(s) > host_at and s[host_at] not in "/?#" and not s[host_at].isspace()
 
 
 def human_readable_rate(bps: float) -> str:
@@ -62,22 +95,102 @@ def format_eta(seconds: int) -> str:
         return f"{int(seconds)}s"
 
 
+# Parsed settings keyed by path, validated against (st_mtime_ns, st_size)
+_SETTINGS_CACHE: dict[Path, tuple[int, int, dict]] = {}
+_SETTINGS_LOCK = threading.Lock()
+
+
 def load_settings(path: Path) -> dict:
     try:
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return {}
+        with _SETTINGS_LOCK:
+            cached = _SETTINGS_CACHE.get(path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return dict(cached[2])
         with path.open("r", encoding="utf-8") as f:
-            return json.load(f) or {}
+            data = json.load(f) or {}
+        with _SETTINGS_LOCK:
+            _SETTINGS_CACHE[path] = (st.st_mtime_ns, st.st_size, dict(data))
+        return data
     except Exception:
         return {}
 
 
-def save_settings(path: Path, data: dict) -> None:
+def save_settings(path: Path, data: dict) -> bool:
+    """Atomically replace the settings file so a crash never leaves torn JSON.
+
+    Returns True if the file was written.
+    """
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data or {}, f, indent=2)
+        tmp = path.with_name(path.name + ".tmp")
+        with _SETTINGS_LOCK:
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(data or {}, f, separators=(",", ":"))
+            os.replace(tmp, path)
+            st = path.stat()
+            _SETTINGS_CACHE[path] = (st.st_mtime_ns, st.st_size, dict(data or {}))
+        return True
     except Exception:
-        pass
+        return False
 
 
+# Background settings writer: callers queue the latest data per path and a
+# daemon thread does the disk I/O off the Tk main thread.
+_writer_q: "queue.Queue[Path]" = queue.Queue()
+# path -> (data, on_saved callback)
+_pending_writes: dict[Path, tuple[dict, Optional[Callable[[dict], None]]]] = {}
+_pending_lock = threading.Lock()
+# Serializes "take pending data + write it" so a newer write never lands first
+_write_lock = threading.Lock()
+_writer_thread: threading.Thread | None = None
+
+
+def _write_pending(path: Path) -> None:
+    with _write_lock:
+        with _pending_lock:
+            pending = _pending_writes.pop(path, None)
+        if pending is None:
+            return
+        data, on_saved = pending
+        if save_settings(path, data) and on_saved is not None:
+            try:
+                on_saved(data)
+            except Exception:
+                pass
+
+
+def _settings_writer() -> None:
+    while True:
+        _write_pending(_writer_q.get())
+
+
+def save_settings_async(path: Path, data: dict, on_saved: Optional[Callable[[dict], None]] = None) -> None:
+    """Queue `data` for writing to `path`; only the latest pending data is written.
+
+    Args:
+        path: Settings file.
+        data: Settings to write.
+        on_saved: Called with the written data after a successful write; runs
+            on the writer thread (or the caller of `flush_settings`).
+    """
+    global _writer_thread
+    with _pending_lock:
+        already_queued = path in _pending_writes
+        _pending_writes[path] = (dict(data or {}), on_saved)
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_settings_writer, name="settings-writer", daemon=True)
+            _writer_thread.start()
+    if not already_queued:
+        _writer_q.put(path)
+
+
+def flush_settings() -> None:
+    """Synchronously write any settings still pending (e.g. on shutdown)."""
+    with _pending_lock:
+        paths = list(_pending_writes)
+    for path in paths:
+        _write_pending(path)
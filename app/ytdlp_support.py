@@ -0,0 +1,27 @@
+"""Lazy access to the optional yt-dlp dependency.
+
+yt-dlp is large and slow to import, so it is loaded on first use rather
+than when the app starts. `get_ytdlp()` returns the module, or None if it
+is not installed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_ytdlp: Any = None
+
+
+def get_ytdlp() -> Any:
+    """Return the yt_dlp module, importing it once; None if unavailable."""
+    global _ytdlp
+    if _ytdlp is None:
+        try:
+            _ytdlp = importlib.import_module("yt_dlp")
+        except Exception:
+            return None
+    return _ytdlp
+
+
+__all__ = ["get_ytdlp"]